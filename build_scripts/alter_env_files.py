@@ -1,35 +1,87 @@
+import atexit
 import os
-import shutil
+import tempfile
+
+# Parsed env files keyed by real path, so repeated upserts against the same
+# file within one run only read it once. Dirty entries are written back by
+# flush_env_files(), which also runs at interpreter exit.
+_ENV_FILE_CACHE: dict[str, list[str]] = {}
+_DIRTY_ENV_FILES: set[str] = set()
+
+
+def _load(file_path: str) -> tuple[str, list[str]]:
+    """Return the cache key and (cached) lines of an env file."""
+    path = os.path.realpath(file_path)
+    lines = _ENV_FILE_CACHE.get(path)
+    if lines is None:
+        try:
+            with open(path, buffering=65536) as env_file:
+                lines = [line.rstrip("\n") for line in env_file]
+        except FileNotFoundError:
+            lines = []
+        _ENV_FILE_CACHE[path] = lines
+    return path, lines
 
 
 def upsert_env_variables(file_path: str, updates: dict[str, str]) -> None:
-    """Update or insert environment variables in a file."""
-    try:
-        with open(file_path) as env_file:
-            original_lines = env_file.read().splitlines()
-    except FileNotFoundError:
-        original_lines = []
-
-    replaced_keys = set()
-    new_lines = []
-
-    for line in original_lines:
-        updated = False
-        for key, value in updates.items():
-            if line.startswith(f"{key}="):
-                new_lines.append(f"{key}={value}")
-                replaced_keys.add(key)
-                updated = True
-                break
-        if not updated:
-            new_lines.append(line)
-
-    for key, value in updates.items():
-        if key not in replaced_keys:
-            new_lines.append(f"{key}={value}")
-
-    with open(file_path, "w") as env_file:
-        env_file.write("\n".join(new_lines) + "\n")
+    """Update or insert environment variables in a file.
+
+    Changes are applied to the in-memory copy of the file; call
+    flush_env_files() to write them out (this also happens at exit).
+    """
+    path, lines = _load(file_path)
+    upd = updates
+    pending = set(upd)
+
+    for i, line in enumerate(lines):
+        key, sep, _ = line.partition("=")
+        if sep and key in upd:
+            lines[i] = f"{key}={upd[key]}"
+            pending.discard(key)
+
+    for key, value in upd.items():
+        if key in pending:
+            lines.append(f"{key}={value}")
+
+    _DIRTY_ENV_FILES.add(path)
+
+
+def flush_env_files() -> None:
+    """Write every modified env file back to disk.
+
+    Each file is written to a temp file in the same directory which then
+    atomically replaces the original, so a crash never leaves it half-written.
+    The temp file gets the original's permissions and ownership before any
+    content is written, so secrets are never exposed under looser permissions.
+    """
+    while _DIRTY_ENV_FILES:
+        path = _DIRTY_ENV_FILES.pop()
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".env-", suffix=".tmp")
+        try:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                # New file: same mode a plain open() would have created
+                umask = os.umask(0)
+                os.umask(umask)
+                os.fchmod(fd, 0o666 & ~umask)
+            else:
+                os.fchmod(fd, st.st_mode & 0o7777)
+                try:
+                    os.fchown(fd, st.st_uid, st.st_gid)
+                except PermissionError:
+                    pass
+            with os.fdopen(fd, "w", buffering=65536) as out:
+                for line in _ENV_FILE_CACHE[path]:
+                    out.write(f"{line}\n")
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+atexit.register(flush_env_files)
 
 
 def main():
@@ -81,6 +133,8 @@ def main():
     
     pass  # Remove this when implementing
 
+    flush_env_files()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,53 @@
+"""Precompute task patches at image build time.
+
+Tasks follow the ``<task_id>_{baseline,test,golden}`` branch convention. The
+project repo is cloned during the build and never fetched at runtime, so the
+``origin/`` refs are fixed in the image and the diffs can be generated once
+here instead of on every task setup:
+
+    <patches_dir>/<task_id>/test.patch    (baseline -> test)
+    <patches_dir>/<task_id>/golden.patch  (baseline -> golden)
+
+setup_task() uses these files when present and only falls back to running
+``git diff`` itself when they are missing.
+"""
+
+import os
+import subprocess
+
+
+def main():
+    project_dir = os.environ.get("PROJECT_DIR", f"/home/ubuntu/{os.environ.get('FOLDER_NAME')}")
+    patches_dir = os.environ.get("PATCHES_DIR", "/home/root/patches")
+
+    result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname:lstrip=3)", "refs/remotes/origin"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    branches = set(result.stdout.split())
+
+    for branch in sorted(branches):
+        if not branch.endswith("_baseline"):
+            continue
+        task_id = branch.removesuffix("_baseline")
+        if not {f"{task_id}_test", f"{task_id}_golden"} <= branches:
+            continue
+
+        task_patches_dir = os.path.join(patches_dir, task_id)
+        os.makedirs(task_patches_dir, exist_ok=True)
+        for kind in ("test", "golden"):
+            with open(f"{task_patches_dir}/{kind}.patch", "wb") as f:
+                subprocess.run(
+                    ["git", "diff", f"origin/{branch}", f"origin/{task_id}_{kind}"],
+                    cwd=project_dir,
+                    stdout=f,
+                    check=True,
+                )
+        print(f"Generated patches for {task_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,13 @@ This environment provides tools for:
 Tools prefixed with _ are internal (hidden from agent, used by scenarios).
 """
 
+import asyncio
+import functools
+import grp
+import hashlib
 import logging
 import os
+import pwd
 import subprocess
 from pathlib import Path
 
@@ -137,7 +142,78 @@ async def editor(
 # ============================================================================
 
 
-def setup_task(task_id: str, base: str, test: str, golden: str, validate_mode: ValidateMode | None = None) -> None:
+@functools.cache
+def _ubuntu_ids() -> tuple[int, int]:
+    """Look up the ubuntu uid/gid once per process."""
+    return pwd.getpwnam("ubuntu").pw_uid, grp.getgrnam("ubuntu").gr_gid
+
+
+def _chown(path: str, uid: int, gid: int) -> None:
+    try:
+        os.chown(path, uid, gid, follow_symlinks=False)
+    except OSError as exc:
+        logger.warning("Failed to chown %s: %s", path, exc)
+
+
+def _chown_tree(root_dir: str, uid: int, gid: int, skip: str | None = None) -> None:
+    """In-process ``chown -R``: never follows symlinks, optionally skips a top-level entry.
+
+    Like ``chown -R``, a failure on one entry is reported and the walk continues.
+    """
+    for root, dirs, files in os.walk(root_dir):
+        if root == root_dir and skip in dirs:
+            dirs.remove(skip)
+        _chown(root, uid, gid)
+        for name in files:
+            _chown(os.path.join(root, name), uid, gid)
+        for name in dirs:
+            path = os.path.join(root, name)
+            if os.path.islink(path):
+                _chown(path, uid, gid)
+
+
+def _patch_digest(path: str | Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def _write_patch(project_dir: str, base: str, rhs: str, dest: str) -> None:
+    """Write ``git diff origin/<base> origin/<rhs>`` to *dest*.
+
+    The diff is streamed into a temp file next to *dest*. An identical
+    existing *dest* is left untouched so its mtime stays stable across
+    re-runs; otherwise it is replaced atomically. As before, a failing diff
+    (e.g. a missing branch) yields an empty patch, but is logged.
+    """
+    tmp = f"{dest}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            result = subprocess.run(
+                ["git", "diff", f"origin/{base}", f"origin/{rhs}"],
+                cwd=project_dir,
+                stdout=f,
+                stderr=subprocess.PIPE,
+            )
+        if result.returncode != 0:
+            logger.warning(
+                "git diff origin/%s origin/%s failed (exit %d): %s",
+                base, rhs, result.returncode, result.stderr.decode(errors="replace").strip(),
+            )
+        if (
+            os.path.exists(dest)
+            and os.path.getsize(dest) == os.path.getsize(tmp)
+            and _patch_digest(dest) == _patch_digest(tmp)
+        ):
+            os.unlink(tmp)
+            return
+        os.replace(tmp, dest)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+async def setup_task(task_id: str, base: str, test: str, golden: str, validate_mode: ValidateMode | None = None) -> None:
     """Set up environment for a task: checkout baseline, generate patches.
     
     Args:
@@ -152,31 +228,29 @@ def setup_task(task_id: str, base: str, test: str, golden: str, validate_mode: V
     # Set PROBLEM_ID env var for grading runner
     os.environ["PROBLEM_ID"] = task_id
     
-    # Generate patches at runtime
+    # Patches for tasks following the <task_id>_{baseline,test,golden}
+    # convention are precomputed at image build time
+    # (build_scripts/generate_patches.py); otherwise generate them here.
     task_patches_dir = os.path.join(patches_dir, task_id)
-    os.makedirs(task_patches_dir, exist_ok=True)
-    
-    # Generate test.patch (base → test)
-    logger.info("Generating test.patch: %s → %s", base, test)
-    result = subprocess.run(
-        ["git", "diff", f"origin/{base}", f"origin/{test}"],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
+    test_patch = f"{task_patches_dir}/test.patch"
+    golden_patch = f"{task_patches_dir}/golden.patch"
+    prebuilt = (
+        (base, test, golden) == (f"{task_id}_baseline", f"{task_id}_test", f"{task_id}_golden")
+        and os.path.exists(test_patch)
+        and os.path.exists(golden_patch)
     )
-    with open(os.path.join(task_patches_dir, "test.patch"), "w") as f:
-        f.write(result.stdout)
-    
-    # Generate golden.patch (base → golden)
-    logger.info("Generating golden.patch: %s → %s", base, golden)
-    result = subprocess.run(
-        ["git", "diff", f"origin/{base}", f"origin/{golden}"],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
-    )
-    with open(os.path.join(task_patches_dir, "golden.patch"), "w") as f:
-        f.write(result.stdout)
+    if prebuilt:
+        logger.info("Using patches precomputed at build time for %s", task_id)
+    else:
+        os.makedirs(task_patches_dir, exist_ok=True)
+
+        # Generate test.patch (base → test) and golden.patch (base → golden) concurrently
+        logger.info("Generating test.patch: %s → %s", base, test)
+        logger.info("Generating golden.patch: %s → %s", base, golden)
+        await asyncio.gather(
+            asyncio.to_thread(_write_patch, project_dir, base, test, test_patch),
+            asyncio.to_thread(_write_patch, project_dir, base, golden, golden_patch),
+        )
     
     # Checkout baseline branch
     if validate_mode == "golden_pass":
@@ -186,24 +260,43 @@ def setup_task(task_id: str, base: str, test: str, golden: str, validate_mode: V
         checkout_branch = base
         logger.info("Checking out baseline branch: %s", checkout_branch)
 
-    result = subprocess.run(
-        ["git", "checkout", "-f", f"origin/{checkout_branch}"],
+    process = await asyncio.create_subprocess_exec(
+        "git", "checkout", "-f", f"origin/{checkout_branch}",
         cwd=project_dir,
-        capture_output=True,
-        text=True,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
     )
-    if result.returncode != 0:
-        logger.error("Failed to checkout %s: %s", checkout_branch, result.stderr)
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        logger.error("Failed to checkout %s: %s", checkout_branch, stderr.decode(errors="replace"))
     else:
         logger.info("Checked out baseline branch: %s", checkout_branch)
-        # Restore file ownership to ubuntu
-        subprocess.run(["chown", "-R", "ubuntu:ubuntu", project_dir], capture_output=True)
-        # Keep .git protected
-        subprocess.run(["chown", "-R", "root:root", os.path.join(project_dir, ".git")], capture_output=True)
+        try:
+            uid, gid = _ubuntu_ids()
+        except KeyError as exc:
+            logger.warning("Failed to restore ownership of %s: %s", project_dir, exc)
+        else:
+            # Restore file ownership to ubuntu, keeping .git protected (root)
+            await asyncio.to_thread(_chown_tree, project_dir, uid, gid, ".git")
+            await asyncio.to_thread(_chown_tree, os.path.join(project_dir, ".git"), 0, 0)
     
     os.chdir(project_dir)
 
 
+async def setup_task_from_id(task_id: str, validate_mode: ValidateMode | None = None) -> None:
+    """Set up a task whose branches follow the ``<task_id>_{baseline,test,golden}`` convention.
+    
+    Args:
+        task_id: Unique identifier for the task (also the branch name prefix)
+        validate_mode: Optional validation mode passed through to setup_task
+    """
+    await setup_task(
+        task_id=task_id,
+        base=f"{task_id}_baseline",
+        test=f"{task_id}_test",
+        golden=f"{task_id}_golden",
+        validate_mode=validate_mode,
+    )
 
 
 def make_prompt(description: str) -> str:
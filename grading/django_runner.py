@@ -12,7 +12,7 @@ import os
 import subprocess
 import uuid
 
-from .runner import GradingRunner
+from .runner import GradingRunner, copy_repo
 
 logger = logging.getLogger(__name__)
 
@@ -49,23 +49,23 @@ class DjangoGradingRunner(GradingRunner):
         os.makedirs(base_dir, exist_ok=True)
 
         logger.info(f"Copying repo to {self.working_dir}")
-        subprocess.run(
-            ["cp", "-rT", self.repo_path, self.working_dir],
-            check=True,
-        )
+        copy_repo(self.repo_path, self.working_dir)
 
         # Apply test patch (adds test files)
         logger.info(f"Applying test patch: {self.test_patch}")
-        with open(self.test_patch) as f:
-            patch_content = f.read()
-
-        if patch_content.strip():
-            subprocess.run(
-                ["git", "apply"],
-                cwd=self.working_dir,
-                input=patch_content.encode(),
-                check=True,
-            )
+        # Only inspect the head of the file for the (common) empty-patch case,
+        # and stream it to patch's stdin so the full patch is never held in memory.
+        size = os.path.getsize(self.test_patch)
+        with open(self.test_patch, "rb") as f:
+            head = f.read(4096) if size else b""
+            if head.strip() or size > len(head):
+                f.seek(0)
+                subprocess.run(
+                    ["patch", "-p1", "--batch", "--forward", "--silent"],
+                    cwd=self.working_dir,
+                    stdin=f,
+                    check=True,
+                )
 
         # Run tests
         success, metadata = self.run_tests()
@@ -1,6 +1,8 @@
 """Graders for evaluating agent solutions."""
 
+import functools
 import os
+from collections.abc import Callable
 
 from .django_runner import DjangoGradingRunner
 from .runner import GradingRunner
@@ -43,6 +45,12 @@ class AgentPatchGrader(Grader):
     name = "AgentPatchGrader"
     DEFAULT_TEST_COMMAND = "uv run pytest {test_files}"
 
+    @staticmethod
+    @functools.cache
+    def _runner_factory(runner_class: type, test_command: str) -> Callable[..., GradingRunner]:
+        """Return a (cached) constructor with the runner class and command bound."""
+        return functools.partial(runner_class, test_command=test_command)
+
     @classmethod
     def compute_score(
         cls,
@@ -69,14 +77,11 @@ class AgentPatchGrader(Grader):
         if not pid:
             raise ValueError("problem_id required (or set PROBLEM_ID env)")
 
-        cmd = test_command or cls.DEFAULT_TEST_COMMAND
-
-        RunnerClass = runner_class or DjangoGradingRunner
-        runner = RunnerClass(
-            problem_id=pid,
-            test_command=cmd,
-            test_files=test_files,
+        make_runner = cls._runner_factory(
+            runner_class or DjangoGradingRunner,
+            test_command or cls.DEFAULT_TEST_COMMAND,
         )
+        runner = make_runner(problem_id=pid, test_files=test_files)
 
         score = runner.grade()
 
@@ -10,11 +10,37 @@ Workflow:
 
 import logging
 import os
+import shlex
+import shutil
 import subprocess
 import uuid
 
 logger = logging.getLogger(__name__)
 
+LOG_TAIL_BYTES = 8192
+SHELL_METACHARS = frozenset("|&;<>()$`\\*?[]{}~!#\n")
+
+
+def copy_repo(src: str, dst: str) -> None:
+    """Copy a repo's working tree into a grading workspace without forking ``cp``.
+
+    Files are real copies, not hardlinks: the test command runs as root and
+    may rewrite files in place (e.g. build caches), which must not leak back
+    into the agent's tree. The top-level ``.git`` directory is skipped:
+    grading only needs the agent's working tree.
+    """
+
+    def ignore_git_dir(directory: str, names: list[str]) -> list[str]:
+        return [".git"] if directory == src and ".git" in names else []
+
+    shutil.copytree(
+        src,
+        dst,
+        symlinks=True,
+        ignore=ignore_git_dir,
+        dirs_exist_ok=True,
+    )
+
 
 class GradingRunner:
     """
@@ -50,10 +76,8 @@ class GradingRunner:
         self.patches_dir = patches_dir
         self.repo_path = repo_path or f"/home/ubuntu/{os.environ.get('FOLDER_NAME', 'project')}"
         self.working_dir = f"/tmp/grading_{uuid.uuid4()}"
-
-    @property
-    def test_patch(self) -> str:
-        return os.path.join(self.patches_dir, self.problem_id, "test.patch")
+        self._task_patches_dir = os.path.join(patches_dir, problem_id)
+        self.test_patch = f"{self._task_patches_dir}/test.patch"
 
     def grade(self) -> float:
         """
@@ -64,15 +88,16 @@ class GradingRunner:
         """
         # Copy repo to grading workspace
         logger.info(f"Copying repo to {self.working_dir}")
-        subprocess.run(["cp", "-rT", self.repo_path, self.working_dir], check=True)
+        copy_repo(self.repo_path, self.working_dir)
 
         # Apply test patch (adds test files)
         logger.info(f"Applying test patch: {self.test_patch}")
-        with open(self.test_patch) as f:
+        # Stream the patch to patch's stdin rather than reading it into memory
+        with open(self.test_patch, "rb") as f:
             subprocess.run(
-                ["git", "apply"],
+                ["patch", "-p1", "--batch", "--forward", "--silent"],
                 cwd=self.working_dir,
-                input=f.read().encode(),
+                stdin=f,
                 check=True,
             )
 
@@ -95,15 +120,33 @@ class GradingRunner:
         cmd = self.test_command.format(test_files=" ".join(self.test_files))
         logger.info(f"Running: {cmd}")
         
-        result = subprocess.run(
-            ["bash", "-lc", cmd],
-            cwd=self.working_dir,
-            capture_output=True,
-            text=True,
-        )
+        # Exec simple commands directly; only pay for a (non-login) shell
+        # when the command actually uses shell syntax, including leading
+        # ``NAME=value`` assignments.
+        argv = shlex.split(cmd) if SHELL_METACHARS.isdisjoint(cmd) else []
+        if not argv or "=" in argv[0]:
+            argv = ["bash", "-c", cmd]
+
+        # Send output to a log file and only keep its tail in memory
+        log_path = os.path.join(self.working_dir, "test.log")
+        with open(log_path, "w+b") as log:
+            try:
+                result = subprocess.run(
+                    argv,
+                    cwd=self.working_dir,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            except FileNotFoundError as exc:
+                # Same outcome bash would report: command not found
+                return False, {"exit_code": 127, "stdout": str(exc), "log_path": log_path}
+
+            size = os.fstat(log.fileno()).st_size
+            log.seek(max(0, size - LOG_TAIL_BYTES))
+            tail = log.read().decode(errors="replace")
 
         return result.returncode == 0, {
             "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": tail,
+            "log_path": log_path,
         }
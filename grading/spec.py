@@ -1,11 +1,10 @@
 """Grading specifications and types."""
 
 import logging
+import math
 from dataclasses import dataclass, field
 from typing import Annotated, Any, Literal
 
-import numpy as np
-
 logger = logging.getLogger(__name__)
 
 ValidateMode = Literal["baseline_fail", "golden_pass"]
@@ -45,38 +44,58 @@ class Grade:
     @property
     def score(self):
         assert self.subscores.keys() == self.weights.keys()
-        assert np.isclose(sum(self.weights.values()), 1)
-        assert min(self.subscores.values()) >= 0
-        assert max(self.subscores.values()) <= 1
 
-        score = sum([self.subscores[key] * self.weights[key] for key in self.subscores.keys()])
-        return np.clip(score, 0.0, 1.0)
+        # Single pass: total weight, weighted sum and subscore bounds
+        weights = self.weights
+        total_weight = 0.0
+        score = 0.0
+        lo = 1.0
+        hi = 0.0
+        for key, subscore in self.subscores.items():
+            weight = weights[key]
+            total_weight += weight
+            score += subscore * weight
+            if subscore < lo:
+                lo = subscore
+            if subscore > hi:
+                hi = subscore
+
+        assert math.isclose(total_weight, 1.0, rel_tol=1e-5, abs_tol=1e-8)
+        assert lo >= 0
+        assert hi <= 1
+        return min(1.0, max(0.0, score))
 
     @staticmethod
     def from_subscores(subscores: list[SubGrade]) -> "Grade":
-        # First pass: count occurrences of each name
-        name_counts = {}
+        # First pass: resolve final names without pre-counting. A repeated
+        # name renames its first occurrence to "<name>-1" and numbers later
+        # ones "<name>-2", "<name>-3", ... Renaming happens in a list so the
+        # output dicts, built in the second pass, keep the input order.
+        final_names: list[str] = []
+        first_index: dict[str, int] = {}
+        name_usage: dict[str, int] = {}
+
         for subscore in subscores:
-            name_counts[subscore.name] = name_counts.get(subscore.name, 0) + 1
+            original_name = subscore.name
+            index = first_index.get(original_name)
+
+            if index is None:
+                first_index[original_name] = len(final_names)
+                final_names.append(original_name)
+                continue
+
+            usage = name_usage.get(original_name, 1)
+            if usage == 1:
+                final_names[index] = f"{original_name}-1"
+            name_usage[original_name] = usage + 1
+            final_names.append(f"{original_name}-{usage + 1}")
 
-        # Second pass: assign final names
+        # Second pass: build the result dicts under the resolved names
         subscores_dict = {}
         weights_dict = {}
         metadata_dict = {}
-        name_usage = {}
-
-        for subscore in subscores:
-            original_name = subscore.name
-
-            if name_counts[original_name] == 1:
-                final_name = original_name
-            else:
-                if original_name not in name_usage:
-                    name_usage[original_name] = 1
-                else:
-                    name_usage[original_name] += 1
-                final_name = f"{original_name}-{name_usage[original_name]}"
 
+        for final_name, subscore in zip(final_names, subscores, strict=True):
             subscores_dict[final_name] = subscore.score
             weights_dict[final_name] = subscore.weight
 
@@ -10,32 +10,47 @@ Actions (flags can be combined, e.g. -bvr):
   -p/--push:      Push Docker image to registry
   -j/--json:      Generate problem-metadata.json
 
-Execution order: build -> validate -> run -> push -> json
+Execution order: build, then validate -> run while push and json
+(which only depend on the build) proceed concurrently.
 
 Parallelism uses asyncio throughout. Validation and run tasks for
-different scenario IDs execute concurrently via asyncio.gather.
+different scenario IDs execute concurrently (bounded by --concurrency),
+and each result is reported as soon as it completes.
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
 import tomllib
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
-import hud
-from hud import Environment
-from hud.agents.claude import ClaudeAgent
+import orjson
+
+# hud (and the Anthropic client behind ClaudeAgent) is slow to import, so it
+# is only imported by the validate/run code paths that actually need it.
+if TYPE_CHECKING:
+    from hud import Environment
+    from hud.agents.claude import ClaudeAgent
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 PYPROJECT_PATH = Path("pyproject.toml")
+TASKS_DIR = Path("tasks")
+SCENARIO_CACHE_PATH = Path(".cache") / "scenarios.json"
 
 
 # ============================================================================
@@ -64,7 +79,7 @@ def read_image_from_pyproject() -> str | None:
 def _looks_like_registry_image(image: str) -> bool:
     """Return True if the image name contains a registry prefix (has a '/')."""
     # Strip the tag/digest to inspect just the name portion
-    name = image.split("@")[0].split(":")[0]
+    name = image.partition("@")[0].partition(":")[0]
     return "/" in name
 
 
@@ -73,12 +88,14 @@ def _looks_like_registry_image(image: str) -> bool:
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=1)
 def discover_scenario_ids() -> list[str]:
     """Auto-discover all registered scenario IDs by importing env.py.
 
     Importing ``env`` triggers ``import tasks`` at the bottom of env.py,
     which runs the ``@env.scenario(...)`` decorators and populates
-    ``env._scenarios`` (a dict keyed by scenario name).
+    ``env._scenarios`` (a dict keyed by scenario name). The result is
+    memoized for the lifetime of the process.
     """
     from env import env as _env  # noqa: WPS433 – intentional late import
 
@@ -87,23 +104,87 @@ def discover_scenario_ids() -> list[str]:
     return ids
 
 
+def _tasks_signature() -> str:
+    """Hash the paths and mtimes of every task module under ``tasks/``."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(TASKS_DIR.rglob("*.py")):
+        digest.update(f"{path}:{path.stat().st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def discover_scenario_ids_cached() -> list[str]:
+    """Like :func:`discover_scenario_ids`, but memoized on disk.
+
+    The result is stored in ``.cache/scenarios.json`` together with a
+    signature of the task modules' mtimes, so importing ``env`` (and every
+    scenario module) is skipped until a file under ``tasks/`` changes.
+    """
+    sig = _tasks_signature()
+    try:
+        with open(SCENARIO_CACHE_PATH, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("sig") == sig:
+            ids = cached["ids"]
+            logger.info(f"Using {len(ids)} cached scenario(s): {ids}")
+            return ids
+    except (OSError, ValueError, KeyError):
+        pass
+
+    ids = discover_scenario_ids()
+    SCENARIO_CACHE_PATH.parent.mkdir(exist_ok=True)
+    with open(SCENARIO_CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"sig": sig, "ids": ids}, f)
+    return ids
+
+
 # ============================================================================
 # Subprocess helpers (async)
 # ============================================================================
 
 
-async def run_subprocess(cmd: list[str], prefix: str) -> int:
+STREAM_CHUNK_SIZE = 65536
+
+
+async def run_subprocess(cmd: list[str], prefix: str, env: dict[str, str] | None = None) -> int:
     """Run a subprocess asynchronously, streaming output. Returns exit code."""
     process = await asyncio.create_subprocess_exec(
         *cmd,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.STDOUT,
+        env=env,
     )
     assert process.stdout is not None
-    async for raw_line in process.stdout:
-        line = raw_line.decode(errors="replace")
-        sys.stdout.write(f"{prefix} {line}")
-    await process.wait()
+    # Forward raw bytes: no per-line decode or string formatting. Reading
+    # large chunks wakes the event loop once per chunk instead of per line;
+    # the prefix is only inserted at line boundaries. A partial line is
+    # carried over to the next chunk, but never more than one chunk's worth,
+    # so memory stays bounded even for output without newlines.
+    prefix_b = f"{prefix} ".encode()
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    pending = b""
+    at_line_start = True
+    try:
+        while chunk := await process.stdout.read(STREAM_CHUNK_SIZE):
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                out.write((prefix_b if at_line_start else b"") + line + b"\n")
+                at_line_start = True
+            if len(pending) >= STREAM_CHUNK_SIZE:
+                out.write((prefix_b if at_line_start else b"") + pending)
+                pending = b""
+                at_line_start = False
+            out.flush()
+        if pending:
+            out.write((prefix_b if at_line_start else b"") + pending)
+            out.flush()
+        await process.wait()
+    except asyncio.CancelledError:
+        # Don't leave the child running when the caller gives up on it
+        process.kill()
+        await process.wait()
+        raise
     return process.returncode or 0
 
 
@@ -112,29 +193,189 @@ async def run_subprocess(cmd: list[str], prefix: str) -> int:
 # ============================================================================
 
 
+BUILD_CACHE_DIR = Path(".hud-build-cache")
+DOCKERFILE_PATH = Path("Dockerfile.hud")
+DOCKERIGNORE_PATH = Path(".dockerignore")
+
+
+def _dockerignore_pattern(pattern: str) -> re.Pattern[str]:
+    """Translate a .dockerignore pattern into a regex over context-relative paths.
+
+    Follows Docker's rules: patterns are anchored at the context root, ``*``
+    and ``?`` do not cross ``/``, ``**`` matches any number of directories,
+    and a pattern also matches everything below a matching directory.
+    """
+    parts = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                parts.append(f"[{pattern[i + 1 : end]}]")
+                i = end
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return re.compile("".join(parts) + "(?:/.*)?")
+
+
+def _load_dockerignore() -> list[tuple[re.Pattern[str], bool, str]]:
+    """Parse .dockerignore into ``(regex, is_exception, pattern)`` tuples, in file order."""
+    if not DOCKERIGNORE_PATH.exists():
+        return []
+    rules = []
+    for line in DOCKERIGNORE_PATH.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        exception = line.startswith("!")
+        pattern = os.path.normpath(line.lstrip("!").strip()).lstrip("/")
+        rules.append((_dockerignore_pattern(pattern), exception, pattern))
+    return rules
+
+
+def _is_ignored(rel_path: str, rules: list[tuple[re.Pattern[str], bool, str]]) -> bool:
+    """Return True if ``rel_path`` is excluded from the build context (last match wins)."""
+    ignored = False
+    for regex, exception, _ in rules:
+        if regex.fullmatch(rel_path):
+            ignored = not exception
+    return ignored
+
+
+def _build_context_hash() -> str:
+    """Hash Dockerfile.hud and every file Docker would send as build context.
+
+    Paths and contents are fed to blake2b in sorted order, so the digest only
+    changes when a file that can affect the build is added, removed or edited.
+    """
+    rules = _load_dockerignore()
+    exception_patterns = [pattern for _, exception, pattern in rules if exception]
+    files = []
+    for dirpath, dirnames, filenames in os.walk("."):
+        rel_dir = os.path.relpath(dirpath, ".").replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        # Prune ignored directories unless an exception could re-include
+        # something below them (e.g. ``!.git/modules/``).
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if not _is_ignored(prefix + d, rules)
+            or any(p.startswith(f"{prefix}{d}/") for p in exception_patterns)
+        ]
+        files.extend(
+            prefix + name for name in filenames if not _is_ignored(prefix + name, rules)
+        )
+
+    h = hashlib.blake2b(digest_size=16)
+    for rel_path in sorted({*files, DOCKERFILE_PATH.as_posix()}):
+        h.update(rel_path.encode() + b"\0")
+        if os.path.islink(rel_path):
+            h.update(os.readlink(rel_path).encode())
+            continue
+        with open(rel_path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _build_cache_path(image: str) -> Path:
+    return BUILD_CACHE_DIR / f"{image.translate(str.maketrans('/:@', '___'))}.hash"
+
+
+async def _local_image_id(image: str) -> str | None:
+    """Return the ID of the locally tagged ``image``, or None if it is absent."""
+    process = await asyncio.create_subprocess_exec(
+        "docker",
+        "image",
+        "inspect",
+        "--format",
+        "{{.Id}}",
+        image,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return None
+    return stdout.decode().strip() or None
+
+
 async def build_image(image: str, *, no_cache: bool = False) -> bool:
     """Build a single Docker image via ``docker build -t <image> -f Dockerfile.hud .``.
 
     If CODING_GITHUB_TOKEN is set in the environment, it is passed as a Docker
     build secret so the Dockerfile can clone private repositories.
+
+    Builds run under BuildKit with inline cache metadata. For registry images
+    (and unless ``no_cache``), the previously pushed image is used as a layer
+    cache source, so unchanged layers are not rebuilt on fresh machines.
+
+    This deliberately goes through the docker CLI rather than the Engine HTTP
+    API: Dockerfile.hud uses ``RUN --mount=type=secret``, which needs the
+    BuildKit session the CLI negotiates and the plain build endpoint lacks.
+
+    The build is skipped entirely when Dockerfile.hud and the build context
+    (honouring .dockerignore) hash the same as the last successful build and
+    that build's image is still the local tag. The hash cannot see upstream
+    changes to the cloned project repo; use ``no_cache`` to force a rebuild.
     """
+    context_hash = await asyncio.to_thread(_build_context_hash)
+    cache_path = _build_cache_path(image)
+    if not no_cache and cache_path.exists():
+        image_id = await _local_image_id(image)
+        if image_id is not None and cache_path.read_text().split() == [context_hash, image_id]:
+            logger.info(f"Build cache hit for {image} (context unchanged), skipping build")
+            return True
+
     logger.info(f"Building image: {image}")
     cmd = ["docker", "build", "-t", image, "-f", "Dockerfile.hud"]
     if no_cache:
         cmd.append("--no-cache")
+    elif _looks_like_registry_image(image):
+        cmd += ["--cache-from", image]
+    cmd += ["--build-arg", "BUILDKIT_INLINE_CACHE=1"]
     if os.environ.get("CODING_GITHUB_TOKEN"):
         cmd += ["--secret", "id=CODING_GITHUB_TOKEN,env=CODING_GITHUB_TOKEN"]
     cmd.append(".")
-    rc = await run_subprocess(cmd, prefix="[build]")
+    rc = await run_subprocess(cmd, prefix="[build]", env={**os.environ, "DOCKER_BUILDKIT": "1"})
     if rc != 0:
         logger.error(f"Build FAILED for {image} (exit code {rc})")
         return False
     logger.info(f"Build succeeded for {image}")
+
+    image_id = await _local_image_id(image)
+    if image_id is not None:
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        cache_path.write_text(f"{context_hash} {image_id}\n")
     return True
 
 
 async def push_image(image: str) -> bool:
-    """Push a single Docker image via ``docker push <image>``."""
+    """Push a single Docker image via ``docker push <image>``.
+
+    The CLI resolves registry credentials (including credential helpers),
+    which the Engine HTTP API expects the caller to supply itself.
+
+    Layer uploads are already parallel; their fan-out is the daemon's
+    ``max-concurrent-uploads`` setting (daemon.json, default 5), which
+    ``docker push`` cannot override per invocation.
+    """
     logger.info(f"Pushing image: {image}")
     cmd = ["docker", "push", image]
     rc = await run_subprocess(cmd, prefix="[push]")
@@ -145,6 +386,64 @@ async def push_image(image: str) -> bool:
     return True
 
 
+# ============================================================================
+# Environment
+# ============================================================================
+
+DEFAULT_CONCURRENCY = 8
+AGENT_MODEL = "claude-sonnet-4-5"
+
+
+async def _limited(sem: asyncio.Semaphore, factory: Callable[[], Awaitable[T]]) -> T:
+    """Await ``factory()`` while holding a slot of *sem*.
+
+    The coroutine is only created once a slot is acquired, so a task cancelled
+    while still queued leaves no never-awaited coroutine behind.
+    """
+    async with sem:
+        return await factory()
+
+
+def connect_environment(image: str) -> Environment:
+    """Create a client-side ``coding`` Environment connected to *image*.
+
+    One connected Environment is shared by every scenario in a batch rather
+    than being rebuilt per scenario. Each eval still gets its own container:
+    scenarios are not isolated from each other inside one (setup_task checks
+    out branches in the shared project dir and sets the process-wide
+    PROBLEM_ID), so multiplexing them onto a single container via exec would
+    let concurrent scenarios clobber each other.
+    """
+    from hud import Environment
+
+    env = Environment("coding")
+    env.connect_image(image)
+    return env
+
+
+class AgentPool:
+    """Reuses ``ClaudeAgent`` instances (and their HTTP clients) across scenarios.
+
+    Each agent serves one eval at a time. Agents are created on demand, so the
+    pool never grows beyond the number of evals in flight (``--concurrency``).
+    An agent whose eval raised or was cancelled is discarded, not reused.
+    """
+
+    def __init__(self, model: str = AGENT_MODEL) -> None:
+        self.model = model
+        self._idle: list[ClaudeAgent] = []
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClaudeAgent]:
+        from hud.agents.claude import ClaudeAgent
+
+        agent = self._idle.pop() if self._idle else ClaudeAgent.create(model=self.model)
+        yield agent
+        # Only reached on a clean exit; on an exception the agent's state is
+        # unknown, so it is dropped rather than handed to the next scenario.
+        self._idle.append(agent)
+
+
 # ============================================================================
 # Validate
 # ============================================================================
@@ -153,13 +452,13 @@ VALIDATE_MODES = ("baseline_fail", "golden_pass")
 
 
 async def validate_scenario(
-    image: str,
+    env: Environment,
     scenario_id: str,
     validate_mode: str,
     *,
     hints_enabled: bool = False,
 ) -> tuple[str, str, float | None]:
-    """Validate a single scenario + mode by running an eval with 0 agent steps.
+    """Validate a single scenario + mode by running an eval without an agent.
 
     Validation runs the scenario's setup and grading without any agent actions.
     For ``baseline_fail`` the grader inverts the score (baseline should fail tests),
@@ -168,17 +467,17 @@ async def validate_scenario(
     Returns:
         (scenario_id, validate_mode, reward)  — reward is None on error.
     """
+    import hud
+
     label = f"{scenario_id} ({validate_mode})"
     logger.info(f"Validating: {label}")
 
-    env = Environment("coding")
-    env.connect_image(image)
-
     try:
         task = env(scenario_id, validate_mode=validate_mode, hints_enabled=hints_enabled)
+        # Entering the eval runs the scenario setup and leaving it grades;
+        # with zero agent steps there is no need to create an agent at all.
         async with hud.eval(task, trace=True, quiet=True) as ctx:
-            agent = ClaudeAgent.create(model="claude-sonnet-4-5")
-            await agent.run(ctx, max_steps=0)
+            pass
         reward = ctx.reward
     except Exception as exc:
         logger.error(f"Validation error for {label}: {exc}")
@@ -192,37 +491,60 @@ async def validate_all(
     scenario_ids: list[str],
     *,
     hints_enabled: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fail_fast: bool = False,
 ) -> tuple[list[str], list[str]]:
     """Validate all scenarios with both ``baseline_fail`` and ``golden_pass`` modes.
 
-    Both modes are expected to yield ``reward == 1.0``.
+    Both modes are expected to yield ``reward == 1.0``. At most *concurrency*
+    evals run at once. With ``fail_fast``, the remaining evals are cancelled
+    as soon as one fails, and only the results collected so far are returned.
 
     Returns:
         (passed_descriptions, failed_descriptions)
     """
-    coros = [
-        validate_scenario(image, sid, mode, hints_enabled=hints_enabled)
+    env = connect_environment(image)
+    sem = asyncio.Semaphore(concurrency)
+    pending = {
+        asyncio.create_task(
+            _limited(
+                sem,
+                functools.partial(
+                    validate_scenario, env, sid, mode, hints_enabled=hints_enabled
+                ),
+            )
+        )
         for sid in scenario_ids
         for mode in VALIDATE_MODES
-    ]
-    results = await asyncio.gather(*coros, return_exceptions=True)
+    }
 
     passed: list[str] = []
     failed: list[str] = []
 
-    for result in results:
-        if isinstance(result, BaseException):
-            failed.append(f"Exception: {result}")
-            continue
-
-        sid, mode, reward = result
-        desc = f"{sid} ({mode})"
-        if reward == 1.0:
-            logger.info(f"  PASS: {desc} -> reward={reward}")
-            passed.append(desc)
-        else:
-            logger.error(f"  FAIL: {desc} -> reward={reward} (expected 1.0)")
-            failed.append(desc)
+    # Report each result as soon as it lands rather than after the slowest one
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            try:
+                sid, mode, reward = task.result()
+            except Exception as exc:
+                failed.append(f"Exception: {exc}")
+                continue
+
+            desc = f"{sid} ({mode})"
+            if reward == 1.0:
+                logger.info("  PASS: %s -> reward=%s", desc, reward)
+                passed.append(desc)
+            else:
+                logger.error("  FAIL: %s -> reward=%s (expected 1.0)", desc, reward)
+                failed.append(desc)
+
+        if fail_fast and failed and pending:
+            logger.warning("Fail-fast: cancelling %d remaining validation(s)", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            break
 
     return passed, failed
 
@@ -233,7 +555,8 @@ async def validate_all(
 
 
 async def run_scenario(
-    image: str,
+    env: Environment,
+    agents: AgentPool,
     scenario_id: str,
     max_steps: int,
     *,
@@ -244,15 +567,13 @@ async def run_scenario(
     Returns:
         (scenario_id, reward)  — reward is None on error.
     """
-    logger.info(f"Running scenario: {scenario_id} (max_steps={max_steps}, hints={hints_enabled})")
+    import hud
 
-    env = Environment("coding")
-    env.connect_image(image)
+    logger.info(f"Running scenario: {scenario_id} (max_steps={max_steps}, hints={hints_enabled})")
 
     try:
         task = env(scenario_id, hints_enabled=hints_enabled)
-        async with hud.eval(task, trace=True) as ctx:
-            agent = ClaudeAgent.create(model="claude-sonnet-4-5")
+        async with agents.acquire() as agent, hud.eval(task, trace=True) as ctx:
             await agent.run(ctx, max_steps=max_steps)
         reward = ctx.reward
     except Exception as exc:
@@ -268,29 +589,42 @@ async def run_all(
     max_steps: int,
     *,
     hints_enabled: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> tuple[list[tuple[str, float]], list[tuple[str, float | None]]]:
-    """Run all scenarios concurrently with an agent.
+    """Run all scenarios concurrently with an agent, at most *concurrency* at once.
 
     Returns:
         (succeeded, failed)  — each entry is (scenario_id, reward).
     """
-    coros = [run_scenario(image, sid, max_steps, hints_enabled=hints_enabled) for sid in scenario_ids]
-    results = await asyncio.gather(*coros, return_exceptions=True)
+    env = connect_environment(image)
+    agents = AgentPool()
+    sem = asyncio.Semaphore(concurrency)
+    coros = [
+        _limited(
+            sem,
+            functools.partial(
+                run_scenario, env, agents, sid, max_steps, hints_enabled=hints_enabled
+            ),
+        )
+        for sid in scenario_ids
+    ]
 
     succeeded: list[tuple[str, float]] = []
     failed: list[tuple[str, float | None]] = []
 
-    for result in results:
-        if isinstance(result, BaseException):
-            failed.append((f"Exception: {result}", None))
+    # Report each result as soon as it lands rather than after the slowest one
+    for next_result in asyncio.as_completed(coros):
+        try:
+            sid, reward = await next_result
+        except Exception as exc:
+            failed.append((f"Exception: {exc}", None))
             continue
 
-        sid, reward = result
         if reward is not None and reward > 0:
-            logger.info(f"  {sid} -> reward={reward}")
+            logger.info("  %s -> reward=%s", sid, reward)
             succeeded.append((sid, reward))
         else:
-            logger.error(f"  {sid} -> reward={reward}")
+            logger.error("  %s -> reward=%s", sid, reward)
             failed.append((sid, reward))
 
     return succeeded, failed
@@ -303,12 +637,11 @@ async def run_all(
 
 def _write_json(data: list[dict], path: str) -> None:
     """Write a JSON list to *path* with trailing newline."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
 
-def generate_json(
+async def generate_json(
     image: str,
     scenario_ids: list[str],
     *,
@@ -325,29 +658,22 @@ def generate_json(
     if hints_enabled:
         scenario_args["hints_enabled"] = True
 
-    # -- problem-metadata.json (includes image) --
-    problem_metadata = [
-        {
-            "env": {"name": env_name},
-            "scenario": f"coding:{sid}",
-            "image": image,
-            "args": {**scenario_args},
-        }
-        for sid in scenario_ids
-    ]
-    _write_json(problem_metadata, "problem-metadata.json")
+    # Single pass over the scenarios. The env/args dicts are read-only, so
+    # every entry shares them instead of getting its own copy.
+    env_ref = {"name": env_name}
+    problem_metadata: list[dict] = []  # problem-metadata.json (includes image)
+    remote_tasks: list[dict] = []  # remote_tasks.json (no image, used by hud eval)
+    for sid in scenario_ids:
+        scenario = f"coding:{sid}"
+        problem_metadata.append({"env": env_ref, "scenario": scenario, "image": image, "args": scenario_args})
+        remote_tasks.append({"env": env_ref, "scenario": scenario, "args": scenario_args})
+
+    # Write both files concurrently off the event loop
+    await asyncio.gather(
+        asyncio.to_thread(_write_json, problem_metadata, "problem-metadata.json"),
+        asyncio.to_thread(_write_json, remote_tasks, "remote_tasks.json"),
+    )
     logger.info(f"Generated problem-metadata.json with {len(problem_metadata)} scenario(s)")
-
-    # -- remote_tasks.json (no image, used by hud eval) --
-    remote_tasks = [
-        {
-            "env": {"name": env_name},
-            "scenario": f"coding:{sid}",
-            "args": {**scenario_args},
-        }
-        for sid in scenario_ids
-    ]
-    _write_json(remote_tasks, "remote_tasks.json")
     logger.info(f"Generated remote_tasks.json with {len(remote_tasks)} scenario(s)")
 
 
@@ -357,7 +683,7 @@ def generate_json(
 
 
 async def async_main(args: argparse.Namespace) -> int:
-    """Execute the requested actions in order: build -> validate -> run -> push -> json."""
+    """Execute the requested actions: build, then validate -> run alongside push and json."""
     # Resolve image name: CLI arg > [tool.hud].image in pyproject.toml
     image: str | None = args.image
     if not image:
@@ -381,7 +707,7 @@ async def async_main(args: argparse.Namespace) -> int:
     scenario_ids: list[str] = args.ids or []
     needs_scenarios = args.validate or args.run or args.json
     if not scenario_ids and needs_scenarios:
-        scenario_ids = discover_scenario_ids()
+        scenario_ids = discover_scenario_ids_cached()
         if not scenario_ids:
             logger.error("No scenarios found. Register scenarios via @env.scenario() in tasks/.")
             return 1
@@ -395,47 +721,9 @@ async def async_main(args: argparse.Namespace) -> int:
         if not ok:
             return 1
 
-    # --- Validate ---
-    if args.validate:
-        logger.info(
-            f"Validating {len(scenario_ids)} scenario(s) "
-            f"× {len(VALIDATE_MODES)} modes ..."
-        )
-        passed, failed = await validate_all(
-            image, scenario_ids, hints_enabled=hints_enabled,
-        )
-
-        logger.info("")
-        logger.info("Validation summary:")
-        if passed:
-            logger.info(f"  Passed ({len(passed)}): {', '.join(passed)}")
-        if failed:
-            logger.error(f"  Failed ({len(failed)}): {', '.join(failed)}")
-            has_failures = True
-
-    # --- Run ---
-    if args.run:
-        logger.info(
-            f"Running {len(scenario_ids)} scenario(s) "
-            f"(max_steps={args.max_steps}) ..."
-        )
-        succeeded, failed_runs = await run_all(
-            image, scenario_ids, args.max_steps, hints_enabled=hints_enabled,
-        )
-
-        logger.info("")
-        logger.info("Run summary:")
-        if succeeded:
-            logger.info(f"  Succeeded ({len(succeeded)}):")
-            for sid, reward in succeeded:
-                logger.info(f"    {sid}: reward={reward}")
-        if failed_runs:
-            logger.error(f"  Failed ({len(failed_runs)}):")
-            for sid, reward in failed_runs:
-                logger.error(f"    {sid}: reward={reward}")
-            has_failures = True
-
-    # --- Push ---
+    # Push and JSON generation only depend on the build, so start them now
+    # and let them overlap with validate/run; results are collected below.
+    push_task: asyncio.Task[bool] | None = None
     if args.push:
         if not _looks_like_registry_image(image):
             logger.warning(
@@ -443,17 +731,89 @@ async def async_main(args: argparse.Namespace) -> int:
                 f"(e.g. 'myregistry.io/org/image:tag'). "
                 f"Pushing a local-only name will likely fail."
             )
-        ok = await push_image(image)
+        push_task = asyncio.create_task(push_image(image))
+
+    json_task: asyncio.Task[None] | None = None
+    if args.json:
+        json_task = asyncio.create_task(generate_json(image, scenario_ids, hints_enabled=hints_enabled))
+
+    # If validate/run raises or the run is interrupted, don't leave the
+    # background push/json tasks orphaned.
+    background = [task for task in (push_task, json_task) if task is not None]
+    try:
+        # --- Validate ---
+        if args.validate:
+            logger.info(
+                f"Validating {len(scenario_ids)} scenario(s) "
+                f"× {len(VALIDATE_MODES)} modes ..."
+            )
+            passed, failed = await validate_all(
+                image,
+                scenario_ids,
+                hints_enabled=hints_enabled,
+                concurrency=args.concurrency,
+                fail_fast=args.fail_fast,
+            )
+
+            logger.info("")
+            logger.info("Validation summary:")
+            if passed:
+                logger.info(f"  Passed ({len(passed)}): {', '.join(passed)}")
+            if failed:
+                logger.error(f"  Failed ({len(failed)}): {', '.join(failed)}")
+                has_failures = True
+
+        # --- Run ---
+        if args.run:
+            logger.info(
+                f"Running {len(scenario_ids)} scenario(s) "
+                f"(max_steps={args.max_steps}) ..."
+            )
+            succeeded, failed_runs = await run_all(
+                image, scenario_ids, args.max_steps, hints_enabled=hints_enabled, concurrency=args.concurrency,
+            )
+
+            logger.info("")
+            logger.info("Run summary:")
+            if succeeded:
+                logger.info(f"  Succeeded ({len(succeeded)}):")
+                for sid, reward in succeeded:
+                    logger.info(f"    {sid}: reward={reward}")
+            if failed_runs:
+                logger.error(f"  Failed ({len(failed_runs)}):")
+                for sid, reward in failed_runs:
+                    logger.error(f"    {sid}: reward={reward}")
+                has_failures = True
+    except BaseException:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        raise
+
+    # --- Push ---
+    if push_task is not None:
+        ok = await push_task
         if not ok:
             has_failures = True
 
     # --- JSON ---
-    if args.json:
-        generate_json(image, scenario_ids, hints_enabled=hints_enabled)
+    if json_task is not None:
+        await json_task
 
     return 1 if has_failures else 0
 
 
+def _positive_int(value: str) -> int:
+    """argparse ``type`` accepting integers >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
 def main(argv: Iterable[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -487,7 +847,7 @@ def main(argv: Iterable[str] | None = None) -> int:
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="Build without Docker cache (forces fresh git clone, dependency install, etc.)",
+        help="Build without Docker cache (forces fresh git clone, dependency install, etc.; also bypasses the unchanged-context skip)",
     )
     parser.add_argument(
         "-p",
@@ -527,6 +887,17 @@ def main(argv: Iterable[str] | None = None) -> int:
         default=20,
         help="Max agent steps for --run (default: 20)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max scenario evals in flight for --validate / --run (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop --validate at the first failing scenario, cancelling the rest",
+    )
 
     args = parser.parse_args(list(argv) if argv is not None else None)
 
@@ -536,7 +907,17 @@ def main(argv: Iterable[str] | None = None) -> int:
         )
         return 0
 
-    return asyncio.run(async_main(args))
+    # uvloop is not available on Windows; fall back to the default event loop
+    # there (or whenever it isn't installed).
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(async_main(args))
 
 
 if __name__ == "__main__":
@@ -5,5 +5,5 @@ Hard tasks involve complex multi-file changes, deep domain logic, or
 architectural decisions.
 """
 
-# from env import env, setup_task, make_prompt
+# from env import env, make_prompt, setup_task_from_id
 # from grading import AgentPatchGrader, Grade, ValidateMode
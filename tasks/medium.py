@@ -5,7 +5,7 @@ Medium tasks require multi-file understanding, domain-specific reasoning,
 or cross-framework knowledge (e.g. Solidity smart contracts).
 """
 
-from env import env, setup_task, make_prompt
+from env import env, make_prompt, setup_task_from_id
 from grading import AgentPatchGrader, Grade, GradingRunner, ValidateMode
 
 
@@ -13,13 +13,7 @@ from grading import AgentPatchGrader, Grade, GradingRunner, ValidateMode
 async def fix_erc20_vulnerabilities(hints_enabled: bool = False, validate_mode: ValidateMode | None = None):
     """Fix security vulnerabilities in an ERC-20 token smart contract."""
 
-    setup_task(
-        task_id="smart_contract_erc20",
-        base="smart_contract_erc20_baseline",
-        test="smart_contract_erc20_test",
-        golden="smart_contract_erc20_golden",
-        validate_mode=validate_mode,
-    )
+    await setup_task_from_id("smart_contract_erc20", validate_mode)
 
     prompt = make_prompt("""Fix the security vulnerabilities in the ERC-20 token contract at src/Token.sol.
 